@@ -4,35 +4,190 @@ Website Content Scraper
 Crawls a website and saves each page's content to separate text files.
 """
 
+import asyncio
+import aiofiles
+import aiohttp
 import requests
-from bs4 import BeautifulSoup
-from urllib.parse import urljoin, urlparse, urlunparse
+import xxhash
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from selectolax.lexbor import LexborHTMLParser
+from urllib.parse import urljoin, urlparse, urlsplit
 import os
 import time
 import re
 from pathlib import Path
 import logging
 from urllib.robotparser import RobotFileParser
-from typing import Set, List
+from typing import Deque, Dict, Optional, List, Tuple
 import argparse
+import functools
+import codecs
+import email.message
+import hashlib
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+# Pages larger than this are skipped rather than buffered in memory
+MAX_PAGE_BYTES = 5 * 1024 * 1024
+CHUNK_SIZE = 64 * 1024
+
+# Sizing of the optional Bloom filter used for link dedup on very large crawls
+BLOOM_CAPACITY = 10_000_000
+BLOOM_FALSE_POSITIVE_RATE = 0.001
+
+# Number of recent robots.txt decisions kept, so memory stays flat on long crawls
+ROBOTS_DECISION_CACHE_SIZE = 1024
+
+# Characters that are not allowed in filenames
+_SANITIZE_RE = re.compile(r'[<>:"/\\|?*]')
+
+# Runs of whitespace collapsed to a single space in page text
+_WS_RE = re.compile(r'\s+')
+
+# <meta charset=...> or <meta http-equiv ... content="...; charset=..."> near the top
+_META_CHARSET_RE = re.compile(rb'<meta[^>]*?charset\s*=\s*["\']?\s*([\w.:-]+)', re.IGNORECASE)
+META_SNIFF_BYTES = 1024
+
+# Common non-content files and paths (tuples so str.endswith/startswith test them in one call)
+_SKIP_EXTS = ('.pdf', '.jpg', '.jpeg', '.png', '.gif', '.css', '.js',
+              '.zip', '.rar', '.exe', '.doc', '.docx', '.xls', '.xlsx')
+_SKIP_PREFIXES = ('/wp-admin', '/admin', '/login', '/logout', '/search',
+                  '/wp-content', '/wp-includes')
+
+# Elements whose content is never part of the page text
+_STRIP_TAGS = ['script', 'style', 'nav', 'footer', 'header', 'noscript', 'iframe', 'svg']
+
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+}
+
+
+def _normalize_url(url: str) -> str:
+    """Normalize URL by removing fragments and sorting query parameters."""
+    # Links have already been through urljoin, so plain splits are enough here
+    url = url.split('#', 1)[0]
+    if '?' in url:
+        base, query = url.split('?', 1)
+        url = f"{base}?{'&'.join(sorted(query.split('&')))}"
+    return url
+
+
+def _clean_text(text: str) -> str:
+    """Clean up whitespace in extracted page text."""
+    return _WS_RE.sub(' ', text).strip()
+
+
+def _charset_from_content_type(content_type: str) -> Optional[str]:
+    """Extract the charset parameter from a Content-Type header value."""
+    if 'charset' not in content_type:
+        return None
+    msg = email.message.Message()
+    msg['content-type'] = content_type
+    # Unlike get_param, this also decodes RFC 2231 charset*= values to a str
+    return msg.get_content_charset()
+
+
+def _build_tree(body: bytes, bs4_fallback: bool, charset: Optional[str] = None) -> LexborHTMLParser:
+    """Parse HTML, optionally falling back to BeautifulSoup when selectolax fails."""
+    # Lexbor reads bytes as UTF-8, so fall back to a <meta charset> near the top
+    # when the header declares none
+    if not charset:
+        match = _META_CHARSET_RE.search(body, 0, META_SNIFF_BYTES)
+        if match:
+            charset = match.group(1).decode('ascii')
+    
+    html = body
+    if charset:
+        try:
+            codec = codecs.lookup(charset).name
+        except LookupError:
+            charset = None
+        else:
+            # Browsers decode ISO-8859-1 as its windows-1252 superset
+            if codec == 'iso8859-1':
+                codec = 'cp1252'
+            # UTF-8 bytes are already what Lexbor expects; only decode other charsets
+            if codec != 'utf-8':
+                html = body.decode(codec, errors='replace')
+    
+    try:
+        tree = LexborHTMLParser(html)
+    except Exception:
+        if not bs4_fallback:
+            raise
+    else:
+        # Lexbor accepts any input, so the failure signal is a non-empty document
+        # that yields no body or no text at all
+        if (not bs4_fallback or not body.strip() or
+                (tree.body is not None and tree.body.text(strip=True))):
+            return tree
+    
+    # Optional dependency, only needed for the fallback
+    from bs4 import BeautifulSoup
+    return LexborHTMLParser(str(BeautifulSoup(body, 'html.parser', from_encoding=charset)))
+
+
+def _parse_worker(body: bytes, url: str, bs4_fallback: bool = False,
+                  charset: Optional[str] = None) -> Tuple[str, str, List[str]]:
+    """
+    Parse a page once and return its title, clean text and absolute links.
+    
+    Kept at module level so it can run in a ProcessPoolExecutor: only the
+    raw body goes to the worker process and a small tuple comes back.
+    """
+    tree = _build_tree(body, bs4_fallback, charset)
+    
+    # Title and fallback heading in one selector pass, before stripping, since
+    # the only <h1> often sits inside <header> or <nav>
+    title = h1 = None
+    for node in tree.css('title, h1'):
+        if node.tag == 'title':
+            if title is None:
+                title = _clean_text(node.text())
+        elif h1 is None:
+            h1 = _clean_text(node.text())
+    
+    # Remove script and style elements
+    tree.strip_tags(_STRIP_TAGS)
+    
+    links = []
+    for node in tree.css('a[href]'):
+        href = node.attributes.get('href')
+        if href:
+            # Convert relative URLs to absolute
+            links.append(_normalize_url(urljoin(url, href)))
+    
+    text = tree.body.text() if tree.body is not None else ""
+    
+    return title or h1 or "Untitled Page", _clean_text(text), links
+
 
 class WebsiteScraper:
     def __init__(self, base_url: str, output_dir: str = "scraped_content", 
-                 delay: float = 1.0, max_pages: int = 100):
+                 delay: float = 1.0, max_pages: int = 100, concurrency: int = 8,
+                 bs4_fallback: bool = False, bloom: bool = False):
         """
         Initialize the website scraper.
         
         Args:
             base_url: The base URL to start scraping from
             output_dir: Directory to save text files
-            delay: Delay between requests in seconds
+            delay: Delay between requests to the same host in seconds
             max_pages: Maximum number of pages to scrape
+            concurrency: Number of pages fetched concurrently
+            bs4_fallback: Re-parse pages selectolax fails on or finds no text in
+                with BeautifulSoup
+            bloom: Track seen links in a Bloom filter instead of an exact set
         """
         self.base_url = base_url.rstrip('/')
         self.domain = urlparse(base_url).netloc
         self.output_dir = Path(output_dir)
         self.delay = delay
         self.max_pages = max_pages
+        self.concurrency = max(1, concurrency)
+        self.bs4_fallback = bs4_fallback
         
         # Create output directory
         self.output_dir.mkdir(exist_ok=True)
@@ -42,122 +197,156 @@ class WebsiteScraper:
                           format='%(asctime)s - %(levelname)s - %(message)s')
         self.logger = logging.getLogger(__name__)
         
-        # Track visited URLs
-        self.visited_urls: Set[str] = set()
-        self.to_visit: List[str] = [base_url]
+        # URLs waiting to be scraped, in order. _seen holds 64-bit hashes of every
+        # link ever considered (queued or visited), so it alone answers dedup
+        self.to_visit: Deque[str] = deque([base_url])
+        if bloom:
+            # Optional dependency; ~2 bytes per link instead of a set entry, at the
+            # cost of occasionally skipping a link that was never actually seen
+            from rbloom import Bloom
+            self._seen = Bloom(BLOOM_CAPACITY, BLOOM_FALSE_POSITIVE_RATE)
+        else:
+            self._seen = set()
+        self._seen.add(xxhash.xxh3_64_intdigest(base_url.encode('utf-8')))
+        
+        # Crawl progress and per-host pacing state
+        self._scraped = 0
+        self._in_flight = 0
+        self._budget: Optional[asyncio.Condition] = None
+        self._host_next: Dict[str, float] = {}
+        
+        # Parsing runs in this pool and files are written through this queue
+        # while a crawl is in progress
+        self._cpu_pool: Optional[ProcessPoolExecutor] = None
+        self._write_q: Optional[asyncio.Queue] = None
         
         # Set up session with headers
         self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        })
+        self.session.headers.update(DEFAULT_HEADERS)
         
-        # Check robots.txt
-        self.robots_parser = self._check_robots_txt()
-    
-    def _check_robots_txt(self) -> RobotFileParser:
-        """Check and parse robots.txt file."""
-        robots_url = urljoin(self.base_url, '/robots.txt')
-        rp = RobotFileParser()
-        rp.set_url(robots_url)
-        try:
-            rp.read()
+        # Larger connection pool and retries for transient server errors
+        retry = Retry(total=3, backoff_factor=0.3,
+                      status_forcelist=(500, 502, 503, 504),
+                      allowed_methods=frozenset(['GET', 'HEAD']))
+        adapter = HTTPAdapter(pool_connections=32, pool_maxsize=64, max_retries=retry)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        
+        # robots.txt parsers per origin, loaded lazily, and a bounded cache of
+        # recent decisions per URL
+        self._robots: Dict[str, RobotFileParser] = {}
+        self._robots_locks: Dict[str, asyncio.Lock] = {}
+        self._robots_allows = functools.lru_cache(maxsize=ROBOTS_DECISION_CACHE_SIZE)(
+            self._check_robots)
+    
+    def _parse_robots(self, robots_url: str, status: int, text: str) -> RobotFileParser:
+        """Build a robots.txt parser from a fetched response."""
+        rp = RobotFileParser(robots_url)
+        # Same status handling as RobotFileParser.read(): other 4xx mean there is
+        # no robots.txt, while a server error leaves every URL refused
+        if status in (401, 403) or status >= 500:
+            rp.disallow_all = True
+        elif 400 <= status < 500:
+            rp.allow_all = True
+        else:
+            rp.parse(text.splitlines())
             self.logger.info(f"Loaded robots.txt from {robots_url}")
-        except Exception as e:
-            self.logger.warning(f"Could not load robots.txt: {e}")
         return rp
     
-    def _can_fetch(self, url: str) -> bool:
-        """Check if we can fetch the URL according to robots.txt."""
+    def _robots_unavailable(self, robots_url: str, error: Exception) -> RobotFileParser:
+        """Fall back to an allow-all parser when robots.txt cannot be loaded."""
+        self.logger.warning(f"Could not load robots.txt from {robots_url}: {error}")
+        rp = RobotFileParser(robots_url)
+        rp.allow_all = True
+        return rp
+    
+    def _check_robots(self, origin: str, url: str) -> bool:
+        """Check a URL against its origin's already loaded robots.txt parser."""
         try:
-            return self.robots_parser.can_fetch('*', url)
-        except:
+            return self._robots[origin].can_fetch('*', url)
+        except Exception:
             return True  # If we can't check, assume we can fetch
     
-    def _normalize_url(self, url: str) -> str:
-        """Normalize URL by removing fragments and sorting query parameters."""
+    def _can_fetch(self, url: str) -> bool:
+        """Check if we can fetch the URL according to robots.txt."""
         parsed = urlparse(url)
-        # Remove fragment
-        normalized = urlunparse((
-            parsed.scheme, parsed.netloc, parsed.path,
-            parsed.params, parsed.query, ''
-        ))
-        return normalized
+        origin = f"{parsed.scheme}://{parsed.netloc}"
+        rp = self._robots.get(origin)
+        if rp is None:
+            robots_url = f"{origin}/robots.txt"
+            try:
+                response = self.session.get(robots_url, timeout=10)
+                rp = self._parse_robots(robots_url, response.status_code, response.text)
+            except requests.RequestException as e:
+                rp = self._robots_unavailable(robots_url, e)
+            self._robots[origin] = rp
+        
+        return self._robots_allows(origin, url)
+    
+    async def _can_fetch_async(self, session: aiohttp.ClientSession,
+                               url: str, host: str) -> bool:
+        """Async counterpart of _can_fetch; loads each robots.txt only once."""
+        origin = f"{url.partition(':')[0]}://{host}"
+        rp = self._robots.get(origin)
+        if rp is None:
+            lock = self._robots_locks.get(origin)
+            if lock is None:
+                lock = self._robots_locks[origin] = asyncio.Lock()
+            
+            # Workers racing on a new host wait for the first fetch instead of repeating it
+            async with lock:
+                rp = self._robots.get(origin)
+                if rp is None:
+                    robots_url = f"{origin}/robots.txt"
+                    try:
+                        async with session.get(robots_url,
+                                               timeout=aiohttp.ClientTimeout(total=10)) as response:
+                            text = await response.text(errors='replace')
+                            rp = self._parse_robots(robots_url, response.status, text)
+                    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                        rp = self._robots_unavailable(robots_url, e)
+                    self._robots[origin] = rp
+        
+        return self._robots_allows(origin, url)
     
     def _is_valid_url(self, url: str) -> bool:
         """Check if URL is valid for scraping."""
-        parsed = urlparse(url)
+        parsed = urlsplit(url)
         
         # Must be same domain
         if parsed.netloc != self.domain:
             return False
         
         # Skip common non-content files
-        skip_extensions = {'.pdf', '.jpg', '.jpeg', '.png', '.gif', '.css', '.js', 
-                          '.zip', '.rar', '.exe', '.doc', '.docx', '.xls', '.xlsx'}
-        
-        if any(parsed.path.lower().endswith(ext) for ext in skip_extensions):
+        if parsed.path.lower().endswith(_SKIP_EXTS):
             return False
         
         # Skip common non-content paths
-        skip_paths = {'/wp-admin', '/admin', '/login', '/logout', '/search', 
-                     '/wp-content', '/wp-includes'}
-        
-        if any(parsed.path.startswith(path) for path in skip_paths):
+        if parsed.path.startswith(_SKIP_PREFIXES):
             return False
         
         return True
     
-    def _extract_links(self, soup: BeautifulSoup, current_url: str) -> List[str]:
-        """Extract all links from the page."""
-        links = []
+    def _extract_links(self, links: List[str]) -> List[str]:
+        """Filter a page's normalized links down to new crawlable ones."""
+        new_links = []
         
-        for link in soup.find_all('a', href=True):
-            href = link['href']
-            
-            # Convert relative URLs to absolute
-            full_url = urljoin(current_url, href)
-            normalized_url = self._normalize_url(full_url)
+        for normalized_url in links:
+            url_hash = xxhash.xxh3_64_intdigest(normalized_url.encode('utf-8'))
+            if url_hash in self._seen:
+                continue
             
-            if (self._is_valid_url(normalized_url) and 
-                normalized_url not in self.visited_urls and 
-                normalized_url not in self.to_visit):
-                links.append(normalized_url)
+            # Invalid links are remembered too, so they are only checked once
+            self._seen.add(url_hash)
+            if self._is_valid_url(normalized_url):
+                new_links.append(normalized_url)
         
-        return links
-    
-    def _clean_text(self, soup: BeautifulSoup) -> str:
-        """Extract and clean text content from HTML."""
-        # Remove script and style elements
-        for script in soup(["script", "style", "nav", "footer", "header"]):
-            script.decompose()
-        
-        # Get text
-        text = soup.get_text()
-        
-        # Clean up whitespace
-        lines = (line.strip() for line in text.splitlines())
-        chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
-        text = ' '.join(chunk for chunk in chunks if chunk)
-        
-        return text
-    
-    def _get_page_title(self, soup: BeautifulSoup) -> str:
-        """Extract page title."""
-        title_tag = soup.find('title')
-        if title_tag:
-            return title_tag.get_text().strip()
-        
-        h1_tag = soup.find('h1')
-        if h1_tag:
-            return h1_tag.get_text().strip()
-        
-        return "Untitled Page"
+        return new_links
     
     def _sanitize_filename(self, filename: str) -> str:
         """Sanitize filename for saving."""
         # Replace invalid characters
-        filename = re.sub(r'[<>:"/\\|?*]', '_', filename)
+        filename = _SANITIZE_RE.sub('_', filename)
         # Limit length
         filename = filename[:100]
         # Remove leading/trailing dots and spaces
@@ -168,41 +357,47 @@ class WebsiteScraper:
         
         return filename
     
+    def _output_path(self, url: str, title: str) -> Path:
+        """Pick the output file for a page."""
+        # A hash of the URL keeps names unique without probing the disk, and a
+        # re-fetched URL simply rewrites its own file
+        url_hash = hashlib.blake2b(url.encode('utf-8'), digest_size=8).hexdigest()
+        
+        # Title suffix is only there for readability
+        return self.output_dir / f"{url_hash}_{self._sanitize_filename(title)[:40]}.txt"
+    
+    def _format_content(self, url: str, title: str, content: str) -> bytes:
+        """Render the text file contents for a page."""
+        header = f"URL: {url}\nTitle: {title}\n" + "=" * 80 + "\n\n"
+        return (header + content).encode('utf-8')
+    
     def _save_content(self, url: str, title: str, content: str) -> None:
         """Save page content to a text file."""
-        # Create filename from URL path and title
-        parsed = urlparse(url)
-        path_parts = [part for part in parsed.path.split('/') if part]
-        
-        if path_parts:
-            filename = f"{'-'.join(path_parts)}_{self._sanitize_filename(title)}"
-        else:
-            filename = f"home_{self._sanitize_filename(title)}"
-        
-        filename = f"{filename}.txt"
-        filepath = self.output_dir / filename
-        
-        # Handle duplicate filenames
-        counter = 1
-        original_filepath = filepath
-        while filepath.exists():
-            stem = original_filepath.stem
-            suffix = original_filepath.suffix
-            filepath = self.output_dir / f"{stem}_{counter}{suffix}"
-            counter += 1
+        filepath = self._output_path(url, title)
         
         # Save content
         try:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(f"URL: {url}\n")
-                f.write(f"Title: {title}\n")
-                f.write("=" * 80 + "\n\n")
-                f.write(content)
+            with open(filepath, 'wb') as f:
+                f.write(self._format_content(url, title, content))
             
             self.logger.info(f"Saved: {filepath}")
         except Exception as e:
             self.logger.error(f"Error saving {filepath}: {e}")
     
+    async def _writer(self) -> None:
+        """Drain the write queue to disk until cancelled."""
+        while True:
+            filepath, payload = await self._write_q.get()
+            try:
+                async with aiofiles.open(filepath, 'wb') as f:
+                    await f.write(payload)
+                
+                self.logger.info(f"Saved: {filepath}")
+            except Exception as e:
+                self.logger.error(f"Error saving {filepath}: {e}")
+            finally:
+                self._write_q.task_done()
+    
     def scrape_page(self, url: str) -> bool:
         """Scrape a single page."""
         try:
@@ -211,75 +406,246 @@ class WebsiteScraper:
                 self.logger.warning(f"Robots.txt disallows: {url}")
                 return False
             
-            # Make request
-            response = self.session.get(url, timeout=10)
-            response.raise_for_status()
+            # Make request; the body is only downloaded once the headers pass
+            with self.session.get(url, timeout=10, stream=True) as response:
+                response.raise_for_status()
+                
+                # Check content type
+                content_type = response.headers.get('content-type', '').lower()
+                if 'text/html' not in content_type:
+                    self.logger.warning(f"Skipping non-HTML content: {url}")
+                    return False
+                
+                if self._exceeds_size_limit(response.headers.get('content-length')):
+                    self.logger.warning(f"Skipping oversized content: {url}")
+                    return False
+                
+                # Read the decompressed stream straight into one buffer; one byte
+                # past the cap is enough to tell an oversized page apart
+                response.raw.decode_content = True
+                body = response.raw.read(MAX_PAGE_BYTES + 1)
+                if len(body) > MAX_PAGE_BYTES:
+                    self.logger.warning(f"Skipping oversized content: {url}")
+                    return False
+            
+            new_links = self._process(url, body, _charset_from_content_type(content_type))
+            self.to_visit.extend(new_links)
+            
+            self.logger.info(f"Scraped: {url} (found {len(new_links)} new links)")
+            return True
             
-            # Check content type
-            content_type = response.headers.get('content-type', '').lower()
-            if 'text/html' not in content_type:
-                self.logger.warning(f"Skipping non-HTML content: {url}")
+        except requests.RequestException as e:
+            self.logger.error(f"Request error for {url}: {e}")
+            return False
+        except Exception as e:
+            self.logger.error(f"Unexpected error for {url}: {e}")
+            return False
+    
+    def _exceeds_size_limit(self, content_length: Optional[str]) -> bool:
+        """Check a Content-Length header against MAX_PAGE_BYTES."""
+        try:
+            return int(content_length or 0) > MAX_PAGE_BYTES
+        except ValueError:
+            return False
+    
+    def _process(self, url: str, body: bytes, charset: Optional[str] = None) -> List[str]:
+        """Parse a downloaded page, save its content and return new links."""
+        title, content, links = _parse_worker(body, url, self.bs4_fallback, charset)
+        
+        # Save content
+        self._save_content(url, title, content)
+        
+        # Extract new links
+        return self._extract_links(links)
+    
+    def _host_delay(self, url: str, host: str) -> float:
+        """Delay between requests to a host, honouring its robots.txt Crawl-delay."""
+        rp = self._robots.get(f"{url.partition(':')[0]}://{host}")
+        crawl_delay = rp.crawl_delay('*') if rp is not None else None
+        return max(self.delay, float(crawl_delay or 0))
+    
+    async def _wait_for_host(self, host: str, delay: float) -> None:
+        """Wait for the next free request slot on a host."""
+        if delay <= 0:
+            return
+        
+        # Reserve a slot before sleeping. Nothing awaits between the read and the
+        # write, so workers on the same host queue up without a lock, and workers
+        # on other hosts are never held up.
+        now = time.monotonic()
+        slot = max(now, self._host_next.get(host, now))
+        self._host_next[host] = slot + delay
+        if slot > now:
+            await asyncio.sleep(slot - now)
+    
+    async def _scrape_page_async(self, session: aiohttp.ClientSession,
+                                 queue: asyncio.Queue, url: str, host: str) -> bool:
+        """Scrape a single page and push its new links onto the queue."""
+        try:
+            # Check robots.txt
+            if not await self._can_fetch_async(session, url, host):
+                self.logger.warning(f"Robots.txt disallows: {url}")
                 return False
             
-            # Parse HTML
-            soup = BeautifulSoup(response.content, 'html.parser')
+            await self._wait_for_host(host, self._host_delay(url, host))
+            
+            # Make request
+            async with session.get(url, timeout=aiohttp.ClientTimeout(total=10)) as response:
+                response.raise_for_status()
+                
+                # Check content type
+                content_type = response.headers.get('content-type', '').lower()
+                if 'text/html' not in content_type:
+                    self.logger.warning(f"Skipping non-HTML content: {url}")
+                    return False
+                
+                if self._exceeds_size_limit(response.headers.get('content-length')):
+                    self.logger.warning(f"Skipping oversized content: {url}")
+                    return False
+                
+                body = bytearray()
+                async for chunk in response.content.iter_chunked(CHUNK_SIZE):
+                    body.extend(chunk)
+                    if len(body) > MAX_PAGE_BYTES:
+                        self.logger.warning(f"Skipping oversized content: {url}")
+                        return False
             
-            # Extract content
-            title = self._get_page_title(soup)
-            content = self._clean_text(soup)
+            # Parse off the event loop, in another process to sidestep the GIL
+            loop = asyncio.get_running_loop()
+            parse_args = (_parse_worker, bytes(body), url, self.bs4_fallback,
+                          _charset_from_content_type(content_type))
+            try:
+                title, content, links = await loop.run_in_executor(self._cpu_pool, *parse_args)
+            except BrokenProcessPool:
+                # Worker processes could not start (e.g. spawn/forkserver without an
+                # `if __name__ == '__main__':` guard); keep parsing in this process
+                if self._cpu_pool is not None:
+                    self.logger.warning("Parser processes unavailable, parsing in-process instead")
+                    self._cpu_pool = None
+                title, content, links = await loop.run_in_executor(None, *parse_args)
             
-            # Save content
-            self._save_content(url, title, content)
+            # Hand the file to the writer task; blocks only if it falls far behind
+            await self._write_q.put((self._output_path(url, title),
+                                     self._format_content(url, title, content)))
             
-            # Extract new links
-            new_links = self._extract_links(soup, url)
-            self.to_visit.extend(new_links)
+            new_links = self._extract_links(links)
+            # _is_valid_url only accepts links on self.domain, so their host is known
+            for link in new_links:
+                queue.put_nowait((link, self.domain))
             
             self.logger.info(f"Scraped: {url} (found {len(new_links)} new links)")
             return True
             
-        except requests.RequestException as e:
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
             self.logger.error(f"Request error for {url}: {e}")
             return False
         except Exception as e:
             self.logger.error(f"Unexpected error for {url}: {e}")
             return False
     
+    async def _worker(self, session: aiohttp.ClientSession, queue: asyncio.Queue) -> None:
+        """Pull URLs off the frontier and scrape them until cancelled."""
+        while True:
+            url, host = await queue.get()
+            try:
+                # Every queued URL is unique (see _seen), so no visited check is needed.
+                # Pages in flight count against the limit so workers never overshoot it,
+                # but a URL is only dropped once the limit is actually reached; until
+                # then wait and see whether the in-flight pages succeed
+                async with self._budget:
+                    await self._budget.wait_for(
+                        lambda: (self._scraped >= self.max_pages or
+                                 self._scraped + self._in_flight < self.max_pages))
+                    if self._scraped >= self.max_pages:
+                        continue
+                    self._in_flight += 1
+                
+                try:
+                    if await self._scrape_page_async(session, queue, url, host):
+                        self._scraped += 1
+                finally:
+                    async with self._budget:
+                        self._in_flight -= 1
+                        self._budget.notify_all()
+            finally:
+                queue.task_done()
+    
+    async def _crawl(self) -> int:
+        """Run the worker pool until the frontier is exhausted."""
+        # Frontier entries carry their host so workers never re-parse the URL
+        queue: asyncio.Queue = asyncio.Queue()
+        while self.to_visit:
+            url = self.to_visit.popleft()
+            queue.put_nowait((url, urlsplit(url).netloc))
+        
+        self._budget = asyncio.Condition()
+        self._write_q = asyncio.Queue(maxsize=256)
+        writer = asyncio.create_task(self._writer())
+        
+        # Non-blocking c-ares DNS when aiodns is installed, instead of getaddrinfo
+        # in the thread pool; resolved hosts stay cached for the whole crawl
+        try:
+            resolver = aiohttp.AsyncResolver()
+        except RuntimeError:
+            resolver = None
+        connector = aiohttp.TCPConnector(resolver=resolver, use_dns_cache=True, ttl_dns_cache=600,
+                                         limit=100, limit_per_host=8)
+        try:
+            # One parser process per CPU core (the executor's default)
+            with ProcessPoolExecutor() as self._cpu_pool:
+                async with aiohttp.ClientSession(connector=connector, headers=DEFAULT_HEADERS) as session:
+                    workers = [asyncio.create_task(self._worker(session, queue))
+                               for _ in range(self.concurrency)]
+                    try:
+                        await queue.join()
+                    finally:
+                        for worker in workers:
+                            worker.cancel()
+                        await asyncio.gather(*workers, return_exceptions=True)
+            
+            # Let pending files finish writing before returning
+            await self._write_q.join()
+        finally:
+            writer.cancel()
+            await asyncio.gather(writer, return_exceptions=True)
+            self._cpu_pool = None
+            self._write_q = None
+        
+        return self._scraped
+    
     def scrape_website(self) -> None:
         """Scrape the entire website."""
         self.logger.info(f"Starting to scrape: {self.base_url}")
         self.logger.info(f"Output directory: {self.output_dir}")
         self.logger.info(f"Max pages: {self.max_pages}")
         
-        scraped_count = 0
-        
-        while self.to_visit and scraped_count < self.max_pages:
-            url = self.to_visit.pop(0)
-            
-            if url in self.visited_urls:
-                continue
-            
-            self.visited_urls.add(url)
-            
-            if self.scrape_page(url):
-                scraped_count += 1
-            
-            # Be respectful - add delay between requests
-            if self.delay > 0:
-                time.sleep(self.delay)
+        scraped_count = asyncio.run(self._crawl())
         
         self.logger.info(f"Scraping completed. Scraped {scraped_count} pages.")
         self.logger.info(f"Files saved in: {self.output_dir}")
 
 def main():
+    # Use the libuv event loop when available (uvloop does not support Windows)
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
+    
     parser = argparse.ArgumentParser(description='Scrape website content to text files')
     parser.add_argument('url', help='Base URL to scrape')
     parser.add_argument('-o', '--output', default='scraped_content',
                        help='Output directory (default: scraped_content)')
     parser.add_argument('-d', '--delay', type=float, default=1.0,
-                       help='Delay between requests in seconds (default: 1.0)')
+                       help='Delay between requests to the same host in seconds (default: 1.0)')
     parser.add_argument('-m', '--max-pages', type=int, default=100,
                        help='Maximum number of pages to scrape (default: 100)')
+    parser.add_argument('-c', '--concurrency', type=int, default=8,
+                       help='Number of pages fetched concurrently (default: 8)')
+    parser.add_argument('--bs4-fallback', action='store_true',
+                       help='Re-parse pages the HTML parser fails on or finds no text in with BeautifulSoup')
+    parser.add_argument('--bloom', action='store_true',
+                       help='Track seen links in a Bloom filter to save memory on very large crawls')
     
     args = parser.parse_args()
     
@@ -292,7 +658,10 @@ def main():
         base_url=args.url,
         output_dir=args.output,
         delay=args.delay,
-        max_pages=args.max_pages
+        max_pages=args.max_pages,
+        concurrency=args.concurrency,
+        bs4_fallback=args.bs4_fallback,
+        bloom=args.bloom
     )
     
     try: